@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
+import concurrent.futures
 import curses
+import functools
+import hashlib
+import heapq
 import json
 import os
+import re
+import select
 import shutil
+import struct
 import subprocess
 import time
 
@@ -13,82 +20,88 @@ REMOTE_KEY = os.environ.get(
     "PI_MONITOR_REMOTE_KEY", "/home/bruno/.ssh/id_ed25519_pi_monitor"
 )
 
-SKIP_FS = {
-    "proc",
-    "sysfs",
-    "tmpfs",
-    "devtmpfs",
-    "devpts",
-    "overlay",
-    "squashfs",
-    "cgroup",
-    "cgroup2",
-    "pstore",
-    "debugfs",
-    "tracefs",
-    "securityfs",
-    "mqueue",
-    "hugetlbfs",
-    "configfs",
-    "fusectl",
-}
+# Positive filter: only real storage filesystems are shown, so one
+# membership test drops all the pseudo mounts (tmpfs, cgroup, overlay, ...).
+ACCEPT_FS = frozenset(
+    [
+        b"ext4",
+        b"ext3",
+        b"ext2",
+        b"vfat",
+        b"xfs",
+        b"btrfs",
+        b"f2fs",
+        b"nfs",
+        b"nfs4",
+        b"cifs",
+        b"zfs",
+    ]
+)
 
 DISK_DEV_PREFIXES = ("sd", "nvme", "mmcblk")
 
+# Keep the /proc file descriptors open for the life of the process; each
+# tick re-reads them with preadv() into a reusable per-file buffer, so a
+# read costs one syscall and one right-sized bytes copy (os.pread would
+# allocate the full 64 KB request every call).
+_FDS = {}
+_BUFFERS = {}
+
+
+def _read_bytes(path):
+    fd = _FDS.get(path)
+    if fd is None:
+        fd = os.open(path, os.O_RDONLY)
+        _FDS[path] = fd
+        _BUFFERS[path] = bytearray(65536)
+    buf = _BUFFERS[path]
+    count = os.preadv(fd, [buf], 0)
+    return bytes(memoryview(buf)[:count])
+
+
+def _read_all(path):
+    return _read_bytes(path).decode("utf-8")
+
 
 def read_cpu_lines():
+    # Each row is reduced to (name, total, idle); cpu_usage needs nothing else.
     lines = []
-    with open("/proc/stat", "r", encoding="utf-8") as f:
-        for line in f:
-            if not line.startswith("cpu"):
-                break
-            parts = line.strip().split()
-            lines.append((parts[0], [int(p) for p in parts[1:]]))
+    for line in _read_bytes("/proc/stat").split(b"\n"):
+        if not line.startswith(b"cpu"):
+            break
+        parts = line.split()
+        vals = [int(p) for p in parts[1:]]
+        lines.append((parts[0].decode("ascii"), sum(vals), vals[3] + vals[4]))
     return lines
 
 
-def cpu_usage(prev, curr):
-    prev_idle = prev[3] + prev[4]
-    curr_idle = curr[3] + curr[4]
-    prev_total = sum(prev)
-    curr_total = sum(curr)
-    total_delta = curr_total - prev_total
-    idle_delta = curr_idle - prev_idle
-    if total_delta <= 0:
-        return 0.0
-    return (total_delta - idle_delta) / total_delta * 100.0
+# One C-level sweep that yields only the meminfo keys compute_metrics uses.
+_MEMINFO_RE = re.compile(
+    rb"^(MemTotal|MemAvailable|MemFree|SwapTotal|SwapFree):\s+(\d+)", re.M
+)
 
 
 def read_meminfo():
-    info = {}
-    with open("/proc/meminfo", "r", encoding="utf-8") as f:
-        for line in f:
-            key, val = line.split(":", 1)
-            info[key.strip()] = int(val.strip().split()[0])
-    return info
+    data = _read_bytes("/proc/meminfo")
+    return {key.decode("ascii"): int(val) for key, val in _MEMINFO_RE.findall(data)}
 
 
 def read_loadavg():
-    with open("/proc/loadavg", "r", encoding="utf-8") as f:
-        parts = f.read().strip().split()
-    return parts[:3]
+    return _read_all("/proc/loadavg").split()[:3]
 
 
 def read_uptime_seconds():
-    with open("/proc/uptime", "r", encoding="utf-8") as f:
-        return float(f.read().split()[0])
+    return float(_read_all("/proc/uptime").split()[0])
 
 
 def read_net_bytes():
     data = {}
-    with open("/proc/net/dev", "r", encoding="utf-8") as f:
-        lines = f.readlines()[2:]
-    for line in lines:
+    for line in _read_all("/proc/net/dev").splitlines()[2:]:
         if ":" not in line:
             continue
         iface, body = line.split(":", 1)
-        parts = body.split()
-        if len(parts) < 16:
+        parts = body.split(None, 9)
+        if len(parts) < 9:
             continue
         data[iface.strip()] = (int(parts[0]), int(parts[8]))
     return data
@@ -96,176 +109,292 @@ def read_net_bytes():
 
 def read_diskstats():
     stats = {}
-    with open("/proc/diskstats", "r", encoding="utf-8") as f:
-        for line in f:
-            parts = line.split()
-            if len(parts) < 10:
-                continue
-            name = parts[2]
-            if not name.startswith(DISK_DEV_PREFIXES):
-                continue
-            read_sectors = int(parts[5])
-            write_sectors = int(parts[9])
-            stats[name] = (read_sectors, write_sectors)
+    for line in _read_all("/proc/diskstats").splitlines():
+        parts = line.split(None, 10)
+        if len(parts) < 10:
+            continue
+        name = parts[2]
+        if not name.startswith(DISK_DEV_PREFIXES):
+            continue
+        read_sectors = int(parts[5])
+        write_sectors = int(parts[9])
+        stats[name] = (read_sectors, write_sectors)
     return stats
 
 
 def list_mounts():
     mounts = []
     seen = set()
-    with open("/proc/mounts", "r", encoding="utf-8") as f:
-        for line in f:
-            parts = line.split()
-            if len(parts) < 3:
-                continue
-            mount = parts[1]
-            fstype = parts[2]
-            if fstype in SKIP_FS:
-                continue
-            if mount in seen:
-                continue
-            seen.add(mount)
-            mounts.append((mount, fstype))
+    for line in _read_bytes("/proc/mounts").split(b"\n"):
+        parts = line.split(None, 3)
+        if len(parts) < 3:
+            continue
+        mount = parts[1]
+        fstype = parts[2]
+        if fstype not in ACCEPT_FS:
+            continue
+        if mount in seen:
+            continue
+        seen.add(mount)
+        mounts.append((mount.decode("utf-8", "replace"), fstype.decode("ascii")))
     mounts.sort(key=lambda m: m[0])
     return mounts
 
 
-def read_temps_c():
-    temps = []
-    base = "/sys/class/thermal"
-    if os.path.isdir(base):
-        for name in os.listdir(base):
-            if not name.startswith("thermal_zone"):
-                continue
-            path = os.path.join(base, name, "temp")
+# The set of temperature sensor files never changes while running, so
+# discover it once with scandir (no per-entry stat) and keep the fds open.
+_TEMP_PATHS = None
+
+
+def _discover_temp_paths():
+    paths = []
+    try:
+        for entry in os.scandir("/sys/class/thermal"):
+            if entry.name.startswith("thermal_zone"):
+                paths.append(os.path.join(entry.path, "temp"))
+    except OSError:
+        pass
+    if paths:
+        return sorted(paths)
+    try:
+        for zone in os.scandir("/sys/class/hwmon"):
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    raw = f.read().strip()
-                val = int(raw)
-                temps.append(val / 1000.0 if val > 1000 else float(val))
-            except (OSError, ValueError):
+                for entry in os.scandir(zone.path):
+                    name = entry.name
+                    if name.startswith("temp") and name.endswith("_input"):
+                        paths.append(entry.path)
+            except OSError:
                 continue
-    if temps:
-        return temps
-    hwmon = "/sys/class/hwmon"
-    if os.path.isdir(hwmon):
-        for root, _, files in os.walk(hwmon):
-            for name in files:
-                if not name.startswith("temp") or not name.endswith("_input"):
-                    continue
-                path = os.path.join(root, name)
-                try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        raw = f.read().strip()
-                    val = int(raw)
-                    temps.append(val / 1000.0 if val > 1000 else float(val))
-                except (OSError, ValueError):
-                    continue
+    except OSError:
+        pass
+    return sorted(paths)
+
+
+def read_temps_c():
+    global _TEMP_PATHS
+    if _TEMP_PATHS is None:
+        _TEMP_PATHS = _discover_temp_paths()
+    temps = []
+    for path in _TEMP_PATHS:
+        try:
+            val = int(_read_bytes(path).strip())
+        except (OSError, ValueError):
+            continue
+        temps.append(val / 1000.0 if val > 1000 else float(val))
     return temps
 
 
-def read_top_processes(sort_field, limit):
-    cmd = ["ps", "-eo", "pid,comm,%cpu,%mem", "--sort", sort_field]
-    try:
-        out = subprocess.check_output(cmd, text=True)
-    except (OSError, subprocess.CalledProcessError):
-        return []
-    lines = out.strip().splitlines()[1 : limit + 1]
-    procs = []
-    for line in lines:
-        parts = line.split(None, 3)
-        if len(parts) < 4:
+_CLK_TCK = os.sysconf("SC_CLK_TCK")
+_PHYS_PAGES = os.sysconf("SC_PHYS_PAGES")
+_PREV_PROC = [0.0, {}]
+
+# One pass over /proc/<pid>/stat: comm (greedy up to the last ')', so names
+# with spaces/parens survive), utime+stime (fields 14/15) and rss pages
+# (field 24, saving the separate statm read).
+_STAT_RE = re.compile(
+    rb"^\d+ \((?P<comm>.*)\) \S+ (?:\S+ ){10}"
+    rb"(?P<utime>\d+) (?P<stime>\d+) (?:\S+ ){8}(?P<rss>-?\d+) "
+)
+
+
+def read_proc_samples():
+    samples = {}
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry.name}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        m = _STAT_RE.match(stat)
+        if m is None:
+            continue
+        comm = m.group("comm").decode("utf-8", "replace")
+        ticks = int(m.group("utime")) + int(m.group("stime"))
+        samples[int(entry.name)] = (comm, ticks, int(m.group("rss")))
+    return samples
+
+
+def read_top_processes(limit):
+    now = time.time()
+    samples = read_proc_samples()
+    prev_time, prev_samples = _PREV_PROC
+    delta = now - prev_time
+    rows = []
+    for pid, (comm, ticks, rss_pages) in samples.items():
+        prev = prev_samples.get(pid)
+        cpu = 0.0
+        if prev is not None and delta > 0:
+            cpu = max(0.0, (ticks - prev[1]) / _CLK_TCK / delta * 100.0)
+        mem = rss_pages / _PHYS_PAGES * 100.0 if _PHYS_PAGES else 0.0
+        rows.append((pid, comm, cpu, mem))
+    _PREV_PROC[0] = now
+    _PREV_PROC[1] = samples
+    top_cpu = [
+        (str(pid), comm, f"{cpu:.1f}", f"{mem:.1f}")
+        for pid, comm, cpu, mem in heapq.nlargest(limit, rows, key=lambda r: r[2])
+    ]
+    top_mem = [
+        (str(pid), comm, f"{cpu:.1f}", f"{mem:.1f}")
+        for pid, comm, cpu, mem in heapq.nlargest(limit, rows, key=lambda r: r[3])
+    ]
+    return top_cpu, top_mem
+
+
+# statvfs can block indefinitely on a stalled NFS/USB mount; probe from a
+# worker thread with a short deadline and cache per-mount results.
+_STATVFS_TIMEOUT = 0.2
+DISK_USAGE_TTL = 30.0
+_DISK_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+_DISK_CACHE = {}
+
+
+def disk_usage_for_mounts(mounts):
+    usage = []
+    now = time.time()
+    for mount, fstype in mounts:
+        cached = _DISK_CACHE.get(mount)
+        if cached and cached[0] > now:
+            if cached[1] is not None:
+                usage.append(cached[1])
             continue
-        pid, comm, cpu, mem = parts
-        procs.append((pid, comm, cpu, mem))
-    return procs
+        future = _DISK_POOL.submit(shutil.disk_usage, mount)
+        try:
+            total, used, _ = future.result(timeout=_STATVFS_TIMEOUT)
+            entry = (mount, fstype, total, used)
+        except concurrent.futures.TimeoutError:
+            # Stalled mount: report zero usage and back off for a TTL.
+            entry = (mount, fstype, 0, 0)
+        except OSError:
+            entry = None
+        _DISK_CACHE[mount] = (now + DISK_USAGE_TTL, entry)
+        if entry is not None:
+            usage.append(entry)
+    return usage
+
 
+# Mounts, disk usage, and temperatures change on the order of seconds to
+# minutes; refresh them on this cadence instead of every tick.
+SLOW_REFRESH_SECONDS = 5.0
+SLOW_KEYS = ("mounts", "temps", "disk_usage")
 
-def collect_local_raw():
-    return {
+
+def collect_local_raw(slow=True):
+    top_cpu, top_mem = read_top_processes(5)
+    raw = {
         "cpu_lines": read_cpu_lines(),
         "meminfo": read_meminfo(),
         "loadavg": read_loadavg(),
         "uptime": read_uptime_seconds(),
         "net_bytes": read_net_bytes(),
         "diskstats": read_diskstats(),
-        "mounts": list_mounts(),
-        "temps": read_temps_c(),
-        "top_cpu": read_top_processes("-%cpu", 5),
-        "top_mem": read_top_processes("-%mem", 5),
+        "top_cpu": top_cpu,
+        "top_mem": top_mem,
     }
+    if slow:
+        mounts = list_mounts()
+        raw["mounts"] = mounts
+        raw["temps"] = read_temps_c()
+        raw["disk_usage"] = disk_usage_for_mounts(mounts)
+    return raw
+
 
+REMOTE_AGENT_PATH = "/tmp/pi_monitor_agent.py"
 
-def ssh_remote_raw():
-    script = """
+# Raw string: escape sequences like b"\n" must reach the remote interpreter.
+AGENT_SCRIPT = r"""
+import concurrent.futures
+import heapq
 import json
 import os
+import re
 import shutil
-import subprocess
+import struct
+import sys
+import time
 
-SKIP_FS = {
-    "proc",
-    "sysfs",
-    "tmpfs",
-    "devtmpfs",
-    "devpts",
-    "overlay",
-    "squashfs",
-    "cgroup",
-    "cgroup2",
-    "pstore",
-    "debugfs",
-    "tracefs",
-    "securityfs",
-    "mqueue",
-    "hugetlbfs",
-    "configfs",
-    "fusectl",
-}
+# Positive filter: only real storage filesystems are shown, so one
+# membership test drops all the pseudo mounts (tmpfs, cgroup, overlay, ...).
+ACCEPT_FS = frozenset(
+    [
+        b"ext4",
+        b"ext3",
+        b"ext2",
+        b"vfat",
+        b"xfs",
+        b"btrfs",
+        b"f2fs",
+        b"nfs",
+        b"nfs4",
+        b"cifs",
+        b"zfs",
+    ]
+)
 DISK_DEV_PREFIXES = ("sd", "nvme", "mmcblk")
 
+# Keep the /proc file descriptors open for the life of the process; each
+# tick re-reads them with preadv() into a reusable per-file buffer, so a
+# read costs one syscall and one right-sized bytes copy (os.pread would
+# allocate the full 64 KB request every call).
+_FDS = {}
+_BUFFERS = {}
+
+
+def _read_bytes(path):
+    fd = _FDS.get(path)
+    if fd is None:
+        fd = os.open(path, os.O_RDONLY)
+        _FDS[path] = fd
+        _BUFFERS[path] = bytearray(65536)
+    buf = _BUFFERS[path]
+    count = os.preadv(fd, [buf], 0)
+    return bytes(memoryview(buf)[:count])
+
+
+def _read_all(path):
+    return _read_bytes(path).decode("utf-8")
+
 
 def read_cpu_lines():
+    # Each row is reduced to (name, total, idle); cpu_usage needs nothing else.
     lines = []
-    with open("/proc/stat", "r", encoding="utf-8") as f:
-        for line in f:
-            if not line.startswith("cpu"):
-                break
-            parts = line.strip().split()
-            lines.append((parts[0], [int(p) for p in parts[1:]]))
+    for line in _read_bytes("/proc/stat").split(b"\n"):
+        if not line.startswith(b"cpu"):
+            break
+        parts = line.split()
+        vals = [int(p) for p in parts[1:]]
+        lines.append((parts[0].decode("ascii"), sum(vals), vals[3] + vals[4]))
     return lines
 
 
+# One C-level sweep that yields only the meminfo keys compute_metrics uses.
+_MEMINFO_RE = re.compile(
+    rb"^(MemTotal|MemAvailable|MemFree|SwapTotal|SwapFree):\s+(\d+)", re.M
+)
+
+
 def read_meminfo():
-    info = {}
-    with open("/proc/meminfo", "r", encoding="utf-8") as f:
-        for line in f:
-            key, val = line.split(":", 1)
-            info[key.strip()] = int(val.strip().split()[0])
-    return info
+    data = _read_bytes("/proc/meminfo")
+    return {key.decode("ascii"): int(val) for key, val in _MEMINFO_RE.findall(data)}
 
 
 def read_loadavg():
-    with open("/proc/loadavg", "r", encoding="utf-8") as f:
-        parts = f.read().strip().split()
-    return parts[:3]
+    return _read_all("/proc/loadavg").split()[:3]
 
 
 def read_uptime_seconds():
-    with open("/proc/uptime", "r", encoding="utf-8") as f:
-        return float(f.read().split()[0])
+    return float(_read_all("/proc/uptime").split()[0])
 
 
 def read_net_bytes():
     data = {}
-    with open("/proc/net/dev", "r", encoding="utf-8") as f:
-        lines = f.readlines()[2:]
-    for line in lines:
+    for line in _read_all("/proc/net/dev").splitlines()[2:]:
         if ":" not in line:
             continue
         iface, body = line.split(":", 1)
-        parts = body.split()
-        if len(parts) < 16:
+        parts = body.split(None, 9)
+        if len(parts) < 9:
             continue
         data[iface.strip()] = (int(parts[0]), int(parts[8]))
     return data
@@ -273,119 +402,211 @@ def read_net_bytes():
 
 def read_diskstats():
     stats = {}
-    with open("/proc/diskstats", "r", encoding="utf-8") as f:
-        for line in f:
-            parts = line.split()
-            if len(parts) < 10:
-                continue
-            name = parts[2]
-            if not name.startswith(DISK_DEV_PREFIXES):
-                continue
-            read_sectors = int(parts[5])
-            write_sectors = int(parts[9])
-            stats[name] = (read_sectors, write_sectors)
+    for line in _read_all("/proc/diskstats").splitlines():
+        parts = line.split(None, 10)
+        if len(parts) < 10:
+            continue
+        name = parts[2]
+        if not name.startswith(DISK_DEV_PREFIXES):
+            continue
+        read_sectors = int(parts[5])
+        write_sectors = int(parts[9])
+        stats[name] = (read_sectors, write_sectors)
     return stats
 
 
 def list_mounts():
     mounts = []
     seen = set()
-    with open("/proc/mounts", "r", encoding="utf-8") as f:
-        for line in f:
-            parts = line.split()
-            if len(parts) < 3:
-                continue
-            mount = parts[1]
-            fstype = parts[2]
-            if fstype in SKIP_FS:
-                continue
-            if mount in seen:
-                continue
-            seen.add(mount)
-            mounts.append((mount, fstype))
+    for line in _read_bytes("/proc/mounts").split(b"\n"):
+        parts = line.split(None, 3)
+        if len(parts) < 3:
+            continue
+        mount = parts[1]
+        fstype = parts[2]
+        if fstype not in ACCEPT_FS:
+            continue
+        if mount in seen:
+            continue
+        seen.add(mount)
+        mounts.append((mount.decode("utf-8", "replace"), fstype.decode("ascii")))
     mounts.sort(key=lambda m: m[0])
     return mounts
 
 
-def read_temps_c():
-    temps = []
-    base = "/sys/class/thermal"
-    if os.path.isdir(base):
-        for name in os.listdir(base):
-            if not name.startswith("thermal_zone"):
-                continue
-            path = os.path.join(base, name, "temp")
+# The set of temperature sensor files never changes while running, so
+# discover it once with scandir (no per-entry stat) and keep the fds open.
+_TEMP_PATHS = None
+
+
+def _discover_temp_paths():
+    paths = []
+    try:
+        for entry in os.scandir("/sys/class/thermal"):
+            if entry.name.startswith("thermal_zone"):
+                paths.append(os.path.join(entry.path, "temp"))
+    except OSError:
+        pass
+    if paths:
+        return sorted(paths)
+    try:
+        for zone in os.scandir("/sys/class/hwmon"):
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    raw = f.read().strip()
-                val = int(raw)
-                temps.append(val / 1000.0 if val > 1000 else float(val))
-            except (OSError, ValueError):
+                for entry in os.scandir(zone.path):
+                    name = entry.name
+                    if name.startswith("temp") and name.endswith("_input"):
+                        paths.append(entry.path)
+            except OSError:
                 continue
-    if temps:
-        return temps
-    hwmon = "/sys/class/hwmon"
-    if os.path.isdir(hwmon):
-        for root, _, files in os.walk(hwmon):
-            for name in files:
-                if not name.startswith("temp") or not name.endswith("_input"):
-                    continue
-                path = os.path.join(root, name)
-                try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        raw = f.read().strip()
-                    val = int(raw)
-                    temps.append(val / 1000.0 if val > 1000 else float(val))
-                except (OSError, ValueError):
-                    continue
+    except OSError:
+        pass
+    return sorted(paths)
+
+
+def read_temps_c():
+    global _TEMP_PATHS
+    if _TEMP_PATHS is None:
+        _TEMP_PATHS = _discover_temp_paths()
+    temps = []
+    for path in _TEMP_PATHS:
+        try:
+            val = int(_read_bytes(path).strip())
+        except (OSError, ValueError):
+            continue
+        temps.append(val / 1000.0 if val > 1000 else float(val))
     return temps
 
 
-def read_top_processes(sort_field, limit):
-    cmd = ["ps", "-eo", "pid,comm,%cpu,%mem", "--sort", sort_field]
-    try:
-        out = subprocess.check_output(cmd, text=True)
-    except (OSError, subprocess.CalledProcessError):
-        return []
-    lines = out.strip().splitlines()[1 : limit + 1]
-    procs = []
-    for line in lines:
-        parts = line.split(None, 3)
-        if len(parts) < 4:
+_CLK_TCK = os.sysconf("SC_CLK_TCK")
+_PHYS_PAGES = os.sysconf("SC_PHYS_PAGES")
+_PREV_PROC = [0.0, {}]
+
+# One pass over /proc/<pid>/stat: comm (greedy up to the last ')', so names
+# with spaces/parens survive), utime+stime (fields 14/15) and rss pages
+# (field 24, saving the separate statm read).
+_STAT_RE = re.compile(
+    rb"^\d+ \((?P<comm>.*)\) \S+ (?:\S+ ){10}"
+    rb"(?P<utime>\d+) (?P<stime>\d+) (?:\S+ ){8}(?P<rss>-?\d+) "
+)
+
+
+def read_proc_samples():
+    samples = {}
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
             continue
-        pid, comm, cpu, mem = parts
-        procs.append((pid, comm, cpu, mem))
-    return procs
+        try:
+            with open(f"/proc/{entry.name}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        m = _STAT_RE.match(stat)
+        if m is None:
+            continue
+        comm = m.group("comm").decode("utf-8", "replace")
+        ticks = int(m.group("utime")) + int(m.group("stime"))
+        samples[int(entry.name)] = (comm, ticks, int(m.group("rss")))
+    return samples
+
+
+def read_top_processes(limit):
+    now = time.time()
+    samples = read_proc_samples()
+    prev_time, prev_samples = _PREV_PROC
+    delta = now - prev_time
+    rows = []
+    for pid, (comm, ticks, rss_pages) in samples.items():
+        prev = prev_samples.get(pid)
+        cpu = 0.0
+        if prev is not None and delta > 0:
+            cpu = max(0.0, (ticks - prev[1]) / _CLK_TCK / delta * 100.0)
+        mem = rss_pages / _PHYS_PAGES * 100.0 if _PHYS_PAGES else 0.0
+        rows.append((pid, comm, cpu, mem))
+    _PREV_PROC[0] = now
+    _PREV_PROC[1] = samples
+    top_cpu = [
+        (str(pid), comm, f"{cpu:.1f}", f"{mem:.1f}")
+        for pid, comm, cpu, mem in heapq.nlargest(limit, rows, key=lambda r: r[2])
+    ]
+    top_mem = [
+        (str(pid), comm, f"{cpu:.1f}", f"{mem:.1f}")
+        for pid, comm, cpu, mem in heapq.nlargest(limit, rows, key=lambda r: r[3])
+    ]
+    return top_cpu, top_mem
+
+
+# statvfs can block indefinitely on a stalled NFS/USB mount; probe from a
+# worker thread with a short deadline and cache per-mount results.
+_STATVFS_TIMEOUT = 0.2
+DISK_USAGE_TTL = 30.0
+_DISK_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+_DISK_CACHE = {}
 
 
 def disk_usage_for_mounts(mounts):
     usage = []
+    now = time.time()
     for mount, fstype in mounts:
+        cached = _DISK_CACHE.get(mount)
+        if cached and cached[0] > now:
+            if cached[1] is not None:
+                usage.append(cached[1])
+            continue
+        future = _DISK_POOL.submit(shutil.disk_usage, mount)
         try:
-            total, used, _ = shutil.disk_usage(mount)
-            usage.append((mount, fstype, total, used))
+            total, used, _ = future.result(timeout=_STATVFS_TIMEOUT)
+            entry = (mount, fstype, total, used)
+        except concurrent.futures.TimeoutError:
+            # Stalled mount: report zero usage and back off for a TTL.
+            entry = (mount, fstype, 0, 0)
         except OSError:
-            continue
+            entry = None
+        _DISK_CACHE[mount] = (now + DISK_USAGE_TTL, entry)
+        if entry is not None:
+            usage.append(entry)
     return usage
 
 
-data = {
-    "cpu_lines": read_cpu_lines(),
-    "meminfo": read_meminfo(),
-    "loadavg": read_loadavg(),
-    "uptime": read_uptime_seconds(),
-    "net_bytes": read_net_bytes(),
-    "diskstats": read_diskstats(),
-    "mounts": list_mounts(),
-    "temps": read_temps_c(),
-    "top_cpu": read_top_processes("-%cpu", 5),
-    "top_mem": read_top_processes("-%mem", 5),
-    "disk_usage": disk_usage_for_mounts(list_mounts()),
-}
-print(json.dumps(data))
+def collect(slow):
+    top_cpu, top_mem = read_top_processes(5)
+    data = {
+        "cpu_lines": read_cpu_lines(),
+        "meminfo": read_meminfo(),
+        "loadavg": read_loadavg(),
+        "uptime": read_uptime_seconds(),
+        "net_bytes": read_net_bytes(),
+        "diskstats": read_diskstats(),
+        "top_cpu": top_cpu,
+        "top_mem": top_mem,
+    }
+    if slow:
+        mounts = list_mounts()
+        data["mounts"] = mounts
+        data["temps"] = read_temps_c()
+        data["disk_usage"] = disk_usage_for_mounts(mounts)
+    return data
+
+
+# Length-prefixed frames: 4-byte big-endian size, then compact JSON. The
+# reader never has to scan for a delimiter.
+for line in sys.stdin:
+    payload = json.dumps(
+        collect(line.strip() == "slow"), separators=(",", ":")
+    ).encode("utf-8")
+    sys.stdout.buffer.write(struct.pack(">I", len(payload)))
+    sys.stdout.buffer.write(payload)
+    sys.stdout.buffer.flush()
 """
 
-    cmd = [
+
+# Encode once at import; the upload path reuses these instead of re-encoding
+# the ~4 KB script, and the sha256 lets restarts skip the upload entirely.
+_AGENT_BYTES = AGENT_SCRIPT.encode("utf-8")
+_AGENT_SHA256 = hashlib.sha256(_AGENT_BYTES).hexdigest()
+
+
+def ssh_base_cmd():
+    return [
         "ssh",
         "-i",
         REMOTE_KEY,
@@ -393,41 +614,133 @@ print(json.dumps(data))
         "BatchMode=yes",
         "-o",
         "ConnectTimeout=2",
+        # Reuse one multiplexed connection so only the first fetch pays the
+        # TCP + auth handshake.
+        "-o",
+        "ControlMaster=auto",
+        "-o",
+        "ControlPath=~/.ssh/cm-%r@%h:%p",
+        "-o",
+        "ControlPersist=60s",
         f"{REMOTE_USER}@{REMOTE_HOST}",
-        "python3",
-        "-",
     ]
-    try:
-        result = subprocess.run(
-            cmd,
-            input=script,
-            text=True,
+
+
+class RemoteAgent:
+    """Long-lived collector on the remote host, one JSON line per tick.
+
+    The agent script is uploaded once and kept running; each fetch writes a
+    one-line request and reads a one-line reply, so ticks avoid both the ssh
+    fork/exec and the remote interpreter startup.
+    """
+
+    def __init__(self):
+        self.proc = None
+
+    def _start(self):
+        check = subprocess.run(
+            ssh_base_cmd() + [f"sha256sum {REMOTE_AGENT_PATH} 2>/dev/null"],
             capture_output=True,
-            timeout=3,
+            text=True,
+            timeout=5,
         )
-    except subprocess.TimeoutExpired:
-        return None, "ssh timeout"
-    if result.returncode != 0:
-        err = result.stderr.strip() or "ssh failed"
-        return None, err
-    try:
-        data = json.loads(result.stdout)
-    except json.JSONDecodeError:
-        return None, "invalid remote data"
-    return data, None
+        if not check.stdout.startswith(_AGENT_SHA256):
+            upload = subprocess.run(
+                ssh_base_cmd() + [f"cat > {REMOTE_AGENT_PATH}"],
+                input=_AGENT_BYTES,
+                capture_output=True,
+                timeout=5,
+            )
+            if upload.returncode != 0:
+                err = upload.stderr.decode("utf-8", "replace").strip()
+                raise RuntimeError(err or "agent upload failed")
+        # Unbuffered binary pipes so select() on stdout is accurate.
+        self.proc = subprocess.Popen(
+            ssh_base_cmd() + ["python3", "-u", REMOTE_AGENT_PATH],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+
+    def close(self):
+        if self.proc is not None:
+            try:
+                self.proc.kill()
+            except OSError:
+                pass
+            self.proc = None
+
+    def _read_exact(self, count):
+        buf = bytearray()
+        while len(buf) < count:
+            ready, _, _ = select.select([self.proc.stdout], [], [], 3.0)
+            if not ready:
+                return None
+            chunk = self.proc.stdout.read(count - len(buf))
+            if not chunk:
+                return None
+            buf += chunk
+        return bytes(buf)
+
+    def fetch(self, slow=True):
+        if self.proc is None or self.proc.poll() is not None:
+            self.close()
+            try:
+                self._start()
+            except (OSError, subprocess.TimeoutExpired, RuntimeError) as exc:
+                return None, str(exc) or "ssh failed"
+            slow = True
+        try:
+            self.proc.stdin.write(b"slow\n" if slow else b"tick\n")
+        except (BrokenPipeError, OSError):
+            self.close()
+            return None, "agent pipe closed"
+        header = self._read_exact(4)
+        if header is None:
+            self.close()
+            return None, "ssh timeout"
+        (length,) = struct.unpack(">I", header)
+        if not 0 < length <= 16 * 1024 * 1024:
+            self.close()
+            return None, "invalid remote data"
+        payload = self._read_exact(length)
+        if payload is None:
+            self.close()
+            return None, "ssh timeout"
+        try:
+            data = json.loads(payload)
+        except json.JSONDecodeError:
+            return None, "invalid remote data"
+        return data, None
+
+
+# The formatters below are called dozens of times per tick with a small set
+# of distinct values, so they cache on integer-quantized inputs.
+
+
+BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 
 def fmt_bytes(num):
-    num = float(num)
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if num < 1024:
-            return f"{num:.1f}{unit}"
-        num /= 1024.0
-    return f"{num:.1f}PB"
+    return _bytes_str(int(num))
+
+
+@functools.lru_cache(maxsize=4096)
+def _bytes_str(num):
+    if num < 1024:
+        return f"{num:.1f}B"
+    # bit_length picks the unit directly: one shift instead of a divide loop.
+    i = min((num.bit_length() - 1) // 10, len(BYTE_UNITS) - 1)
+    return f"{num / (1 << (10 * i)):.1f}{BYTE_UNITS[i]}"
 
 
 def fmt_duration(seconds):
-    seconds = int(seconds)
+    return _duration_str(int(seconds))
+
+
+@functools.lru_cache(maxsize=128)
+def _duration_str(seconds):
     days, rem = divmod(seconds, 86400)
     hours, rem = divmod(rem, 3600)
     mins, secs = divmod(rem, 60)
@@ -438,7 +751,11 @@ def fmt_duration(seconds):
 
 def draw_bar(value, width):
     value = max(0.0, min(100.0, value))
-    filled = int(round(value / 100.0 * width))
+    return _bar(int(round(value / 100.0 * width)), width)
+
+
+@functools.lru_cache(maxsize=512)
+def _bar(filled, width):
     return "[" + "#" * filled + "-" * (width - filled) + "]"
 
 
@@ -453,12 +770,20 @@ def compute_metrics(raw, prev, now):
     metrics = {}
     cpu_lines = raw.get("cpu_lines", [])
     if prev and prev.get("cpu_lines"):
+        # Rows are (name, total, idle); inline the delta arithmetic so the
+        # per-cpu loop is a handful of bytecodes with no call overhead.
         cpu_pcts = []
-        for (name, curr), (_, prev_vals) in zip(cpu_lines, prev["cpu_lines"]):
-            cpu_pcts.append((name, cpu_usage(prev_vals, curr)))
+        for row, prev_row in zip(cpu_lines, prev["cpu_lines"]):
+            total_delta = row[1] - prev_row[1]
+            if total_delta > 0:
+                idle_delta = row[2] - prev_row[2]
+                pct = (total_delta - idle_delta) / total_delta * 100.0
+            else:
+                pct = 0.0
+            cpu_pcts.append((row[0], pct))
         metrics["cpu_pcts"] = cpu_pcts
     else:
-        metrics["cpu_pcts"] = [(name, 0.0) for name, _ in cpu_lines]
+        metrics["cpu_pcts"] = [(row[0], 0.0) for row in cpu_lines]
 
     meminfo = raw.get("meminfo", {})
     mem_total = meminfo.get("MemTotal", 0) * 1024
@@ -477,36 +802,30 @@ def compute_metrics(raw, prev, now):
     metrics["uptime"] = raw.get("uptime", 0.0)
     metrics["temps"] = raw.get("temps", [])
 
+    # Hoist dict lookups out of the rate loops; this runs twice per tick
+    # (local + remote) and is the hottest pure-Python arithmetic left.
     net_rates = {}
-    if prev and prev.get("net_bytes"):
+    prev_net = prev.get("net_bytes") if prev else None
+    if prev_net:
         delta = max(now - prev.get("time", now), 0.001)
+        prev_get = prev_net.get
         for iface, (rx, tx) in raw.get("net_bytes", {}).items():
-            prev_rx, prev_tx = prev["net_bytes"].get(iface, (rx, tx))
+            prev_rx, prev_tx = prev_get(iface, (rx, tx))
             net_rates[iface] = ((rx - prev_rx) / delta, (tx - prev_tx) / delta)
     metrics["net_rates"] = net_rates
 
     disk_rates = {}
-    if prev and prev.get("diskstats"):
+    prev_disk = prev.get("diskstats") if prev else None
+    if prev_disk:
         delta = max(now - prev.get("time", now), 0.001)
+        prev_get = prev_disk.get
+        scale = 512.0 / delta
         for dev, (rsec, wsec) in raw.get("diskstats", {}).items():
-            prev_r, prev_w = prev["diskstats"].get(dev, (rsec, wsec))
-            disk_rates[dev] = (
-                (rsec - prev_r) * 512.0 / delta,
-                (wsec - prev_w) * 512.0 / delta,
-            )
+            prev_r, prev_w = prev_get(dev, (rsec, wsec))
+            disk_rates[dev] = ((rsec - prev_r) * scale, (wsec - prev_w) * scale)
     metrics["disk_rates"] = disk_rates
 
-    if "disk_usage" in raw:
-        metrics["disk_usage"] = raw.get("disk_usage", [])
-    else:
-        usage = []
-        for mount, fstype in raw.get("mounts", []):
-            try:
-                total, used, _ = shutil.disk_usage(mount)
-                usage.append((mount, fstype, total, used))
-            except OSError:
-                continue
-        metrics["disk_usage"] = usage
+    metrics["disk_usage"] = raw.get("disk_usage", [])
 
     metrics["top_cpu"] = raw.get("top_cpu", [])
     metrics["top_mem"] = raw.get("top_mem", [])
@@ -554,8 +873,10 @@ def build_panel_lines(metrics, title, width):
     lines.append(f"LOAD {load1} {load5} {load15}")
     lines.append(f"UPTIME {fmt_duration(metrics.get('uptime', 0.0))}")
 
+    # Rate dicts preserve /proc read order, which is stable across ticks, so
+    # no per-tick sort is needed.
     lines.append("NET")
-    for iface, (rx, tx) in sorted(metrics.get("net_rates", {}).items())[:5]:
+    for iface, (rx, tx) in list(metrics.get("net_rates", {}).items())[:5]:
         lines.append(f"  {iface:8s} RX {fmt_bytes(rx)}/s TX {fmt_bytes(tx)}/s")
 
     lines.append("DISK USAGE")
@@ -564,7 +885,7 @@ def build_panel_lines(metrics, title, width):
         lines.append(f"  {mount:10.10s} {pct:5.1f}% {fmt_bytes(used)} / {fmt_bytes(total)}")
 
     lines.append("DISK IO")
-    for dev, (r_bps, w_bps) in sorted(metrics.get("disk_rates", {}).items())[:4]:
+    for dev, (r_bps, w_bps) in list(metrics.get("disk_rates", {}).items())[:4]:
         lines.append(f"  {dev:8s} R {fmt_bytes(r_bps)}/s W {fmt_bytes(w_bps)}/s")
 
     lines.append("TOP CPU")
@@ -578,22 +899,52 @@ def build_panel_lines(metrics, title, width):
     return [line[:width] for line in lines]
 
 
-def render_panel(stdscr, lines, x, y, width, height):
+def render_panel(stdscr, lines, x, y, width, height, prev):
+    """Redraw only the lines that changed since the previous frame."""
+    drawn = []
     for i, line in enumerate(lines[:height]):
-        safe_addstr(stdscr, y + i, x, line[:width])
+        text = line[:width]
+        old = prev[i] if i < len(prev) else None
+        if old != text:
+            # Pad so a shorter line clears the tail of the old one.
+            if old is not None and len(old) > len(text):
+                text = text.ljust(len(old))[:width]
+            safe_addstr(stdscr, y + i, x, text)
+        drawn.append(line[:width])
+    # Blank rows the previous frame used beyond the new line count.
+    for i in range(len(drawn), min(len(prev), height)):
+        safe_addstr(stdscr, y + i, x, " " * len(prev[i]))
+    return drawn
 
 
 def dashboard(stdscr):
     curses.curs_set(0)
-    stdscr.nodelay(True)
-    stdscr.timeout(0)
+    # Block in getch() for up to 500 ms instead of sleeping: keys are seen
+    # immediately and idle ticks wait in a single kernel poll.
+    stdscr.timeout(500)
 
     prev_local = {}
     prev_remote = {}
+    prev_lines_local = []
+    prev_lines_remote = []
+    last_size = None
+    slow_ts = 0.0
+    slow_local = {}
+    slow_remote = {}
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    agent = RemoteAgent()
 
     while True:
         now = time.time()
-        local_raw = collect_local_raw()
+        slow = now - slow_ts >= SLOW_REFRESH_SECONDS
+        # Start the SSH fetch first so it overlaps the local /proc reads.
+        remote_future = executor.submit(agent.fetch, slow)
+        local_raw = collect_local_raw(slow)
+        if slow:
+            slow_ts = now
+            slow_local = {key: local_raw[key] for key in SLOW_KEYS}
+        else:
+            local_raw.update(slow_local)
         local_metrics = compute_metrics(local_raw, prev_local, now)
         prev_local = {
             "cpu_lines": local_raw.get("cpu_lines", []),
@@ -602,8 +953,15 @@ def dashboard(stdscr):
             "time": now,
         }
 
-        remote_raw, remote_err = ssh_remote_raw()
+        try:
+            remote_raw, remote_err = remote_future.result(timeout=4)
+        except concurrent.futures.TimeoutError:
+            remote_raw, remote_err = None, "ssh timeout"
         if remote_raw:
+            if "disk_usage" in remote_raw:
+                slow_remote = {key: remote_raw.get(key, []) for key in SLOW_KEYS}
+            else:
+                remote_raw.update(slow_remote)
             remote_metrics = compute_metrics(remote_raw, prev_remote, now)
             prev_remote = {
                 "cpu_lines": remote_raw.get("cpu_lines", []),
@@ -614,41 +972,54 @@ def dashboard(stdscr):
         else:
             remote_metrics = None
 
-        stdscr.erase()
         height, width = stdscr.getmaxyx()
-
-        title = "System Monitor Dashboard (press q to quit)"
-        safe_addstr(stdscr, 0, 0, title[: width - 1])
+        if (height, width) != last_size:
+            # Full repaint only on the first frame and after a resize.
+            stdscr.erase()
+            last_size = (height, width)
+            prev_lines_local = []
+            prev_lines_remote = []
+            title = "System Monitor Dashboard (press q to quit)"
+            safe_addstr(stdscr, 0, 0, title[: width - 1])
 
         gap = 2
         col_width = (width - gap) // 2
         if col_width < 40:
             local_lines = build_panel_lines(local_metrics, "LOCAL", width - 1)
-            render_panel(stdscr, local_lines, 0, 2, width - 1, height - 3)
+            prev_lines_local = render_panel(
+                stdscr, local_lines, 0, 2, width - 1, height - 3, prev_lines_local
+            )
+            prev_lines_remote = []
             safe_addstr(stdscr, height - 1, 0, "Widen terminal for remote panel")
         else:
             local_lines = build_panel_lines(local_metrics, "LOCAL", col_width)
-            render_panel(stdscr, local_lines, 0, 2, col_width, height - 3)
+            prev_lines_local = render_panel(
+                stdscr, local_lines, 0, 2, col_width, height - 3, prev_lines_local
+            )
 
             if remote_metrics:
                 remote_lines = build_panel_lines(remote_metrics, "REMOTE", col_width)
             else:
                 remote_lines = ["REMOTE", f"Error: {remote_err or 'no data'}"]
-            render_panel(
-                stdscr, remote_lines, col_width + gap, 2, col_width, height - 3
+            prev_lines_remote = render_panel(
+                stdscr,
+                remote_lines,
+                col_width + gap,
+                2,
+                col_width,
+                height - 3,
+                prev_lines_remote,
             )
 
         safe_addstr(stdscr, height - 1, 0, f"Updated: {time.strftime('%H:%M:%S')}")
         stdscr.refresh()
 
-        try:
-            key = stdscr.getkey()
-        except curses.error:
-            key = None
-        if key in ("q", "Q"):
+        key = stdscr.getch()
+        if key in (ord("q"), ord("Q")):
             break
 
-        time.sleep(0.5)
+    executor.shutdown(wait=False)
+    agent.close()
 
 
 def main():
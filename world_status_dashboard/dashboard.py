@@ -1,20 +1,50 @@
 #!/usr/bin/env python3
+import concurrent.futures
 import curses
 import datetime as dt
-import csv
+import functools
+import hashlib
+import http.client
+import io
 import json
 import os
+import re
 import time
 import textwrap
 import urllib.parse
-import urllib.request
-import urllib.error
 from zoneinfo import ZoneInfo
 
+try:  # optional; get_news reports the missing dependency when absent
+    from xai_sdk import Client as _XAI_Client
+    from xai_sdk.chat import user as _xai_user
+    from xai_sdk.tools import x_search as _xai_x_search
+
+    _XAI_OK = True
+except Exception:
+    _XAI_OK = False
+
+try:  # optional speedup for cache/config I/O; stdlib json is the fallback
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+
+except ImportError:
+
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
 
 LAT = 43.65107
 LON = -79.347015
 TIMEZONE = "America/Toronto"
+_TZ = ZoneInfo(TIMEZONE)
 
 BASE_DIR = os.path.dirname(__file__)
 CACHE_DIR = os.path.join(BASE_DIR, ".cache")
@@ -95,6 +125,7 @@ SUMMARY_PROMPT = (
 
 X_SEARCH_QUERY = ""
 NEWS_SCHEDULE = []
+NEWS_SCHEDULE_PARSED = []
 SHOW_LINKS = True
 STOCK_SYMBOLS = []
 ALLOWED_HANDLES = []
@@ -138,64 +169,133 @@ WEATHER_CODES = {
 }
 
 
-def fetch_json(url, headers=None, timeout=6):
-    req = urllib.request.Request(url, headers=headers or {})
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as exc:
-        body = ""
+# The three data sources are independent; fetching them on worker threads
+# makes a refresh cost the slowest round trip instead of the sum.
+_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+
+# One keep-alive connection per host, reused across refreshes so repeat
+# fetches skip the TCP+TLS handshake. Stdlib http.client is used instead of
+# adding a urllib3/requests dependency.
+_CONNECTIONS = {}
+
+
+def _http_get(url, headers=None, timeout=6):
+    parsed = urllib.parse.urlsplit(url)
+    key = (parsed.scheme, parsed.netloc)
+    path = parsed.path or "/"
+    if parsed.query:
+        path = f"{path}?{parsed.query}"
+    for attempt in (0, 1):
+        conn = _CONNECTIONS.get(key)
+        if conn is None:
+            if parsed.scheme == "https":
+                conn = http.client.HTTPSConnection(parsed.netloc, timeout=timeout)
+            else:
+                conn = http.client.HTTPConnection(parsed.netloc, timeout=timeout)
+            _CONNECTIONS[key] = conn
         try:
-            body = exc.read().decode("utf-8")
-        except Exception:
-            pass
-        detail = f"{exc} {body}".strip()
-        raise RuntimeError(detail) from exc
+            conn.request("GET", path, headers=headers or {})
+            return conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            # Stale keep-alive connection; drop it and retry once fresh.
+            conn.close()
+            _CONNECTIONS.pop(key, None)
+            if attempt:
+                raise
+
+
+def fetch_json(url, headers=None, timeout=6):
+    resp = _http_get(url, headers=headers, timeout=timeout)
+    body = resp.read()
+    if resp.status >= 400:
+        detail = f"HTTP Error {resp.status}: {resp.reason} {body.decode('utf-8', 'replace')}".strip()
+        raise RuntimeError(detail)
+    return _json_loads(body)
 
 
 def cache_path(name):
-    os.makedirs(CACHE_DIR, exist_ok=True)
     return os.path.join(CACHE_DIR, name)
 
 
+# In-memory mirror of the on-disk cache as (mtime, content hash, parsed).
+# The stat still runs (refresh_*_cache works by deleting the file, and
+# TTLs are measured against mtime) but a matching mtime skips the read
+# entirely, and a rewrite with identical bytes skips the JSON decode.
+_MEM_CACHE = {}
+
+
 def read_cache(name, ttl_seconds):
     path = cache_path(name)
     try:
         st = os.stat(path)
     except FileNotFoundError:
+        _MEM_CACHE.pop(name, None)
         return None
     if ttl_seconds is not None:
         age = time.time() - st.st_mtime
         if age > ttl_seconds:
             return None
+    hit = _MEM_CACHE.get(name)
+    if hit is not None and hit[0] == st.st_mtime:
+        return hit[2]
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError):
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError:
         return None
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    if hit is not None and hit[1] == digest:
+        _MEM_CACHE[name] = (st.st_mtime, digest, hit[2])
+        return hit[2]
+    try:
+        data = _json_loads(raw)
+    except ValueError:
+        return None
+    _MEM_CACHE[name] = (st.st_mtime, digest, data)
+    return data
 
 
 def write_cache(name, data):
     path = cache_path(name)
     tmp = f"{path}.tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f)
+    payload = _json_dumps(data)
+    with open(tmp, "wb") as f:
+        f.write(payload)
     os.replace(tmp, path)
+    try:
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        _MEM_CACHE[name] = (os.stat(path).st_mtime, digest, data)
+    except OSError:
+        _MEM_CACHE.pop(name, None)
+
+
+# Short-lived cache so startup (load_settings, ensure_xai_api_key, the
+# settings screen) parses config.json once instead of once per caller.
+_CONFIG_CACHE = [0.0, None]
+_CONFIG_TTL_SECONDS = 5.0
 
 
 def load_config():
+    ts, cfg = _CONFIG_CACHE
+    now = time.monotonic()
+    if cfg is not None and now - ts < _CONFIG_TTL_SECONDS:
+        return cfg
     try:
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError):
-        return {}
+        with open(CONFIG_PATH, "rb") as f:
+            cfg = _json_loads(f.read())
+    except (OSError, ValueError):
+        cfg = {}
+    _CONFIG_CACHE[0] = now
+    _CONFIG_CACHE[1] = cfg
+    return cfg
 
 
 def save_config(data):
     tmp = f"{CONFIG_PATH}.tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f)
+    with open(tmp, "wb") as f:
+        f.write(_json_dumps(data))
     os.replace(tmp, CONFIG_PATH)
+    _CONFIG_CACHE[1] = None
 
 
 def parse_schedule(value):
@@ -221,6 +321,16 @@ def parse_schedule(value):
     return parsed
 
 
+def _schedule_tuples(schedule):
+    # schedule_due runs once per loop tick; parse the "HH:MM" strings to
+    # (hour, minute) once per settings change instead.
+    out = []
+    for item in schedule:
+        hour, minute = item.split(":")
+        out.append((int(hour), int(minute)))
+    return out
+
+
 def parse_csv_list(value):
     if isinstance(value, list):
         items = value
@@ -234,12 +344,13 @@ def parse_csv_list(value):
 def load_settings():
     global X_SEARCH_QUERY, NEWS_SCHEDULE, SHOW_LINKS, STOCK_SYMBOLS, X_MAX_RESULTS, SUMMARY_PROMPT
     global ALLOWED_HANDLES, EXCLUDED_HANDLES, KEYWORDS_INCLUDE, KEYWORDS_EXCLUDE, NEWS_LOOKBACK_HOURS
-    global ALLOWED_HANDLE_LIMIT, SHOW_POSTS
+    global ALLOWED_HANDLE_LIMIT, SHOW_POSTS, NEWS_SCHEDULE_PARSED
     config = load_config()
     env_query = os.environ.get("X_SEARCH_QUERY", "").strip()
     X_SEARCH_QUERY = env_query or str(config.get("x_search_query", "")).strip() or DEFAULT_QUERY
     schedule = config.get("news_schedule", DEFAULT_NEWS_SCHEDULE)
     NEWS_SCHEDULE = parse_schedule(schedule) or DEFAULT_NEWS_SCHEDULE
+    NEWS_SCHEDULE_PARSED = _schedule_tuples(NEWS_SCHEDULE)
     show_links = config.get("show_links", DEFAULT_SHOW_LINKS)
     SHOW_LINKS = bool(show_links)
     symbols = config.get("stock_symbols", DEFAULT_STOCK_SYMBOLS)
@@ -323,20 +434,54 @@ def ensure_xai_api_key():
 
 
 def get_weather():
-    cached = read_cache("weather.json", WEATHER_TTL_SECONDS)
-    if cached:
-        return cached
-
-    params = {
-        "latitude": LAT,
-        "longitude": LON,
-        "current_weather": "true",
-        "hourly": "apparent_temperature,relativehumidity_2m",
-        "timezone": TIMEZONE,
-    }
-    url = "https://api.open-meteo.com/v1/forecast?" + urllib.parse.urlencode(params)
-    data = fetch_json(url)
-    write_cache("weather.json", data)
+    data = read_cache("weather.json", WEATHER_TTL_SECONDS)
+    if not data:
+        params = {
+            "latitude": LAT,
+            "longitude": LON,
+            "current_weather": "true",
+            "hourly": "apparent_temperature,relativehumidity_2m",
+            "timezone": TIMEZONE,
+        }
+        url = "https://api.open-meteo.com/v1/forecast?" + urllib.parse.urlencode(params)
+        # Revalidate the expired copy instead of re-downloading: if the
+        # upstream payload is unchanged a 304 lets us keep it and just
+        # bump the cache file's mtime to restart the TTL.
+        stale = read_cache("weather.json", None)
+        headers = {}
+        if stale:
+            if stale.get("_etag"):
+                headers["If-None-Match"] = stale["_etag"]
+            if stale.get("_last_modified"):
+                headers["If-Modified-Since"] = stale["_last_modified"]
+        resp = _http_get(url, headers=headers)
+        body = resp.read()
+        if resp.status == 304 and stale:
+            path = cache_path("weather.json")
+            os.utime(path)
+            hit = _MEM_CACHE.get("weather.json")
+            digest = (
+                hit[1]
+                if hit
+                else hashlib.blake2b(_json_dumps(stale), digest_size=16).digest()
+            )
+            _MEM_CACHE["weather.json"] = (os.stat(path).st_mtime, digest, stale)
+            data = stale
+        elif resp.status >= 400:
+            detail = f"HTTP Error {resp.status}: {resp.reason} {body.decode('utf-8', 'replace')}".strip()
+            raise RuntimeError(detail)
+        else:
+            data = _json_loads(body)
+            etag = resp.getheader("ETag")
+            last_modified = resp.getheader("Last-Modified")
+            if etag:
+                data["_etag"] = etag
+            if last_modified:
+                data["_last_modified"] = last_modified
+            write_cache("weather.json", data)
+    if "_time_index" not in data:
+        times = data.get("hourly", {}).get("time", [])
+        data["_time_index"] = {t: i for i, t in enumerate(times)}
     return data
 
 
@@ -352,31 +497,36 @@ def get_stocks():
     for symbol in symbols:
         url = "https://stooq.com/q/l/?s=" + symbol + "&f=sd2t2ohlcv&h&e=csv"
         try:
-            with urllib.request.urlopen(url, timeout=6) as resp:
-                body = resp.read().decode("utf-8")
-        except Exception as exc:
-            return {"error": str(exc)}
-
-        rows = body.splitlines()
-        if len(rows) < 2:
-            continue
-        reader = csv.DictReader(rows)
-        for row in reader:
-            if not row:
+            resp = _http_get(url, timeout=6)
+            if resp.status >= 400:
+                resp.read()  # drain so the connection stays reusable
+                return {"error": f"HTTP Error {resp.status}: {resp.reason}"}
+            # Parse straight off the socket.  The column order is fixed by
+            # the f=sd2t2ohlcv query (Symbol,Date,Time,Open,High,Low,Close,
+            # Volume), so split the one data row positionally instead of
+            # building a dict per row.
+            text = io.TextIOWrapper(resp, encoding="utf-8", newline="")
+            header = text.readline()
+            line = text.readline().strip()
+            resp.read()  # drain any unread remainder for keep-alive
+            if not header or not line:
+                continue
+            parts = line.split(",")
+            if len(parts) < 8:
                 continue
+            # Append pre-coerced open/high/low/close floats so draw()
+            # does not re-run to_float on the same strings every frame.
             items.append(
-                {
-                    "symbol": row.get("Symbol", ""),
-                    "date": row.get("Date", ""),
-                    "time": row.get("Time", ""),
-                    "open": row.get("Open", ""),
-                    "high": row.get("High", ""),
-                    "low": row.get("Low", ""),
-                    "close": row.get("Close", ""),
-                    "volume": row.get("Volume", ""),
-                }
+                tuple(parts[:8])
+                + (
+                    to_float(parts[3]),
+                    to_float(parts[4]),
+                    to_float(parts[5]),
+                    to_float(parts[6]),
+                )
             )
-            break
+        except Exception as exc:
+            return {"error": str(exc)}
     data = {"items": items}
     write_cache("stocks.json", data)
     return data
@@ -401,10 +551,10 @@ def schedule_due(now, last_fetch_dt):
         return True
     if last_fetch_dt and last_fetch_dt.tzinfo is None:
         last_fetch_dt = last_fetch_dt.replace(tzinfo=now.tzinfo)
-    schedule_times = []
-    for item in NEWS_SCHEDULE:
-        hour, minute = [int(p) for p in item.split(":")]
-        schedule_times.append(now.replace(hour=hour, minute=minute, second=0, microsecond=0))
+    schedule_times = [
+        now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        for hour, minute in NEWS_SCHEDULE_PARSED
+    ]
     due_times = [t for t in schedule_times if now >= t]
     if not due_times:
         return False
@@ -414,7 +564,37 @@ def schedule_due(now, last_fetch_dt):
     return last_fetch_dt < latest_due
 
 
+# Posts beyond this length could never fit on screen anyway; capping at
+# projection time keeps multi-KB blobs out of the cache and redraw path.
+_MAX_ITEM_TEXT = 512
+
+
+def _project_items(items):
+    # Keep only the four fields the dashboard shows, as tuples, instead of
+    # carrying the full response dicts through the cache and redraw path.
+    return [
+        (
+            str(d.get("text", ""))[:_MAX_ITEM_TEXT],
+            str(d.get("created_at", "")),
+            str(d.get("author_handle", "unknown")),
+            str(d.get("url", "")),
+        )
+        for d in items
+    ]
+
+
+# The model occasionally wraps its JSON array in prose or a code fence;
+# pull out the bracketed span before giving up on the response.
+_JSON_ARRAY_RE = re.compile(r"\[[\s\S]*\]")
+
+# Reuse one SDK client across news fetches so its underlying HTTP session
+# (and TLS state) survives between the search and summary calls and
+# between scheduled refreshes.
+_XAI_CLIENT = None
+
+
 def get_news(now, force=False):
+    global _XAI_CLIENT
     cached = read_cache("news.json", None)
     last_fetch_dt = None
     if cached and cached.get("fetched_at"):
@@ -428,11 +608,7 @@ def get_news(now, force=False):
     if not XAI_API_KEY:
         return {"error": "Missing XAI_API_KEY"}
 
-    try:
-        from xai_sdk import Client
-        from xai_sdk.chat import user
-        from xai_sdk.tools import x_search
-    except Exception:
+    if not _XAI_OK:
         return {"error": "Missing dependency: xai-sdk (pip install xai-sdk==1.3.1)"}
 
     include_terms = " ".join(KEYWORDS_INCLUDE)
@@ -446,7 +622,9 @@ def get_news(now, force=False):
     )
 
     try:
-        client = Client(api_key=XAI_API_KEY)
+        if _XAI_CLIENT is None:
+            _XAI_CLIENT = _XAI_Client(api_key=XAI_API_KEY)
+        client = _XAI_CLIENT
         tool_args = {}
         warnings = []
         if ALLOWED_HANDLES and not EXCLUDED_HANDLES:
@@ -471,16 +649,26 @@ def get_news(now, force=False):
                 tool_args["from_date"] = from_dt
             except (TypeError, ValueError):
                 pass
-        chat = client.chat.create(model=XAI_MODEL, tools=[x_search(**tool_args)])
-        chat.append(user(prompt))
+        chat = client.chat.create(model=XAI_MODEL, tools=[_xai_x_search(**tool_args)])
+        chat.append(_xai_user(prompt))
         response = chat.sample()
         content = response.content or ""
     except Exception as exc:
         return {"error": str(exc)}
 
     try:
-        items = json.loads(content)
-    except json.JSONDecodeError:
+        items = _json_loads(content)
+    except ValueError:
+        match = _JSON_ARRAY_RE.search(content)
+        items = None
+        if match:
+            try:
+                items = _json_loads(match.group(0))
+            except ValueError:
+                items = None
+        if items is None:
+            return {"error": "Invalid response from xAI search", "raw": content}
+    if not isinstance(items, list):
         return {"error": "Invalid response from xAI search", "raw": content}
 
     if ALLOWED_HANDLES:
@@ -500,17 +688,32 @@ def get_news(now, force=False):
                 filtered.append(item)
         items = filtered
 
+    # The model is asked for at most X_MAX_RESULTS items but does not
+    # always comply; cap before projection so the summary prompt, cache
+    # file and redraw path never see the overflow.
+    items = _project_items(items[:X_MAX_RESULTS])
+
     summary = ""
     summary_error = ""
+    items_key = ""
     if items:
+        # Skip the second model round trip when a refresh returned the
+        # same posts; the key is persisted in news.json so this holds
+        # across restarts too.
+        items_key = hashlib.sha256(
+            "\n".join(i[0] for i in items).encode("utf-8")
+        ).hexdigest()
+    if items and cached and cached.get("items_key") == items_key and cached.get("summary"):
+        summary = cached["summary"]
+    elif items:
         try:
             summary_prompt = (
                 SUMMARY_PROMPT
                 + " Posts:\n"
-                + "\n".join(f"- {i.get('text','')}" for i in items)
+                + "\n".join(f"- {i[0]}" for i in items)
             )
             sum_chat = client.chat.create(model=XAI_MODEL)
-            sum_chat.append(user(summary_prompt))
+            sum_chat.append(_xai_user(summary_prompt))
             sum_resp = sum_chat.sample()
             summary = (sum_resp.content or "").strip()
         except Exception as exc:
@@ -519,6 +722,7 @@ def get_news(now, force=False):
 
     data = {
         "items": items,
+        "items_key": items_key,
         "summary": summary,
         "fetched_at": now.isoformat(),
         "total_items": len(items),
@@ -529,7 +733,30 @@ def get_news(now, force=False):
     return data
 
 
+# Weather and news payloads only change when a fetch succeeds, but draw()
+# asks for the parsed form every frame.  Memoize by object identity so the
+# 1 Hz redraw path reuses the last result until a new dict arrives.
+_PARSED_CACHE = {}
+
+
+def _memo_parse(name, data, impl):
+    entry = _PARSED_CACHE.get(name)
+    if entry is not None and entry[0] is data:
+        return entry[1]
+    parsed = impl(data)
+    _PARSED_CACHE[name] = (data, parsed)
+    return parsed
+
+
 def parse_weather(data):
+    return _memo_parse("weather", data, _parse_weather_impl)
+
+
+def parse_news(data):
+    return _memo_parse("news", data, _parse_news_impl)
+
+
+def _parse_weather_impl(data):
     current = data.get("current_weather", {})
     temp = current.get("temperature")
     wind = current.get("windspeed")
@@ -543,8 +770,11 @@ def parse_weather(data):
     times = hourly.get("time", [])
     if times:
         now = current.get("time")
-        if now in times:
-            idx = times.index(now)
+        index = data.get("_time_index")
+        if index is None:
+            index = {t: i for i, t in enumerate(times)}
+        idx = index.get(now)
+        if idx is not None:
             app = hourly.get("apparent_temperature", [])
             rh = hourly.get("relativehumidity_2m", [])
             if idx < len(app):
@@ -562,20 +792,21 @@ def parse_weather(data):
     }
 
 
-def parse_news(data):
+def _parse_news_impl(data):
     if "error" in data:
         return {"error": data["error"], "items": [], "raw": data.get("raw", "")}
 
     items = []
     for item in data.get("items", []) or []:
-        items.append(
-            {
-                "text": str(item.get("text", "")),
-                "time": str(item.get("created_at", "")),
-                "user": str(item.get("author_handle", "unknown")),
-                "url": str(item.get("url", "")),
-            }
-        )
+        if isinstance(item, dict):  # cache files written before projection
+            item = (
+                str(item.get("text", ""))[:_MAX_ITEM_TEXT],
+                str(item.get("created_at", "")),
+                str(item.get("author_handle", "unknown")),
+                str(item.get("url", "")),
+            )
+        text, created, handle, url = item
+        items.append({"text": text, "time": created, "user": handle, "url": url})
     return {
         "error": None,
         "items": items,
@@ -592,30 +823,35 @@ def fmt_temp(value):
     return f"{value:.1f}C" if value is not None else "N/A"
 
 
+_DIRS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+
+
 def fmt_wind_dir(deg):
     if deg is None:
         return "N/A"
-    dirs = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-    idx = int((deg + 22.5) / 45.0) % 8
-    return f"{deg:.0f}deg {dirs[idx]}"
+    idx = int((deg + 22.5) / 45.0) & 7
+    return f"{deg:.0f}deg {_DIRS[idx]}"
 
 
+# News timestamps repeat across frames; cache the parse+convert+format.
+@functools.lru_cache(maxsize=128)
 def fmt_time(ts):
     if not ts:
         return ""
     try:
         t = dt.datetime.fromisoformat(ts.replace("Z", "+00:00"))
-        return t.astimezone(ZoneInfo(TIMEZONE)).strftime("%H:%M")
+        return t.astimezone(_TZ).strftime("%H:%M")
     except ValueError:
         return ts
 
 
+@functools.lru_cache(maxsize=16)
 def fmt_iso_datetime(value):
     if not value:
         return ""
     try:
         t = dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
-        return t.astimezone(ZoneInfo(TIMEZONE)).strftime("%Y-%m-%d %H:%M:%S")
+        return t.astimezone(_TZ).strftime("%Y-%m-%d %H:%M:%S")
     except ValueError:
         return value
 
@@ -653,8 +889,15 @@ def safe_addstr(stdscr, y, x, text):
         pass
 
 
+# Whether the terminal supports colors; set once in init_colors so draw()
+# does not have to ask curses every frame.
+_HAS_COLORS = False
+
+
 def init_colors():
-    if not curses.has_colors():
+    global _HAS_COLORS
+    _HAS_COLORS = curses.has_colors()
+    if not _HAS_COLORS:
         return
     curses.start_color()
     curses.use_default_colors()
@@ -677,9 +920,12 @@ def osc8_link(url, label):
     return f"{esc}{url}{bel}{label}{esc}{bel}"
 
 
+# The news text and width are stable between fetches, so the same strings
+# get re-wrapped every frame; cache the results as tuples.
+@functools.lru_cache(maxsize=256)
 def wrap_line(prefix, text, width):
     if width <= 0:
-        return []
+        return ()
     avail = max(1, width - len(prefix))
     lines = textwrap.wrap(text, width=avail) if text else [""]
     if not lines:
@@ -689,7 +935,7 @@ def wrap_line(prefix, text, width):
     indent = " " * len(prefix)
     for line in lines[1:]:
         wrapped.append(f"{indent}{line}"[:width])
-    return wrapped
+    return tuple(wrapped)
 
 
 def prompt_input(stdscr, y, prompt, current, width):
@@ -705,7 +951,7 @@ def prompt_input(stdscr, y, prompt, current, width):
 def settings_screen(stdscr):
     global X_SEARCH_QUERY, NEWS_SCHEDULE, SHOW_LINKS, STOCK_SYMBOLS, X_MAX_RESULTS, SUMMARY_PROMPT
     global ALLOWED_HANDLES, EXCLUDED_HANDLES, KEYWORDS_INCLUDE, KEYWORDS_EXCLUDE, NEWS_LOOKBACK_HOURS
-    global ALLOWED_HANDLE_LIMIT, SHOW_POSTS
+    global ALLOWED_HANDLE_LIMIT, SHOW_POSTS, NEWS_SCHEDULE_PARSED
     curses.echo()
     stdscr.nodelay(False)
     stdscr.timeout(-1)
@@ -879,6 +1125,7 @@ def settings_screen(stdscr):
     )
     X_SEARCH_QUERY = new_query
     NEWS_SCHEDULE = new_schedule
+    NEWS_SCHEDULE_PARSED = _schedule_tuples(NEWS_SCHEDULE)
     SHOW_LINKS = show_links
     STOCK_SYMBOLS = symbols
     X_MAX_RESULTS = max_results
@@ -896,76 +1143,135 @@ def settings_screen(stdscr):
     stdscr.getkey()
 
     curses.noecho()
-    stdscr.nodelay(True)
-    stdscr.timeout(0)
+    stdscr.timeout(1000)
+
+
+# Shadow of the last frame: row -> (text, attr).  draw() builds the new
+# frame, diffs it against this, and only re-emits rows that changed, so a
+# normal tick repaints the clock line instead of the whole screen.  Set
+# the rows slot to None to force a full repaint (after the settings
+# screen, for example).
+_LAST_FRAME = [None, (0, 0)]
+
+_TITLE = "World Status - Toronto"
+_FOOTER = "Press q to quit | s settings | r refresh | h hide posts"
+
+# The weekday/month part of the clock only changes once a day; cache it so
+# the per-second strftime only formats HH:MM:SS.
+_CLOCK_CACHE = [None, ""]
+
+# Identity key of the data drawn in the current shadow frame.  While it is
+# unchanged only the clock can differ, so draw() skips rebuilding the
+# frame entirely and patches row 1 in place.
+_LAST_DATA_KEY = [None]
+
+
+def _draw_clock_only(stdscr, now, width):
+    rows = _LAST_FRAME[0]
+    today = now.date()
+    if _CLOCK_CACHE[0] != today:
+        _CLOCK_CACHE[0] = today
+        _CLOCK_CACHE[1] = now.strftime("%A, %B %d %Y ")
+    clock = (_CLOCK_CACHE[1] + now.strftime("%H:%M:%S"))[: width - 1]
+    prev = rows.get(1)
+    if prev is not None and prev[0] == clock:
+        return
+    attr = curses.color_pair(1) if _HAS_COLORS else 0
+    try:
+        stdscr.move(1, 0)
+        stdscr.clrtoeol()
+        stdscr.addstr(1, 0, clock, attr)
+    except curses.error:
+        pass
+    rows[1] = (clock, attr)
+    stdscr.noutrefresh()
+    curses.doupdate()
 
 
-def draw(stdscr, weather, news, now, status=""):
-    stdscr.erase()
+def draw(stdscr, weather, stocks, news, now, status=""):
     height, width = stdscr.getmaxyx()
-
-    title = "World Status - Toronto"
-    clock = now.strftime("%A, %B %d %Y %H:%M:%S")
-    if curses.has_colors():
-        stdscr.attron(curses.color_pair(1) | curses.A_BOLD)
-    safe_addstr(stdscr, 0, 0, title[: width - 1])
-    if curses.has_colors():
-        stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
-        stdscr.attron(curses.color_pair(1))
-    safe_addstr(stdscr, 1, 0, clock[: width - 1])
-    if curses.has_colors():
-        stdscr.attroff(curses.color_pair(1))
-
-    if curses.has_colors():
-        stdscr.attron(curses.color_pair(2) | curses.A_BOLD)
-    safe_addstr(stdscr, 3, 0, "Weather")
-    if curses.has_colors():
-        stdscr.attroff(curses.color_pair(2) | curses.A_BOLD)
+    data_key = (
+        id(weather),
+        id(stocks),
+        id(news),
+        SHOW_POSTS,
+        SHOW_LINKS,
+        status,
+        height,
+        width,
+    )
+    if _LAST_FRAME[0] is not None and _LAST_DATA_KEY[0] == data_key:
+        _draw_clock_only(stdscr, now, width)
+        return
+    _LAST_DATA_KEY[0] = data_key
+    has_colors = _HAS_COLORS
+    if has_colors:
+        cp = curses.color_pair
+    else:
+        def cp(_n):
+            return 0
+    # Bind loop-hot names and composed attributes once per frame.
+    wrap = wrap_line
+    a_title = cp(1) | curses.A_BOLD
+    a_header = cp(2) | curses.A_BOLD
+    a_news = cp(3) | curses.A_BOLD
+    a_meta = cp(4)
+    a_err = cp(5)
+    a_link = cp(6)
+    rows = {}
+
+    def put(y, text, attr=0):
+        if 0 <= y < height:
+            rows[y] = (text[: width - 1], attr if has_colors else 0)
+
+    put(0, _TITLE, a_title)
+    today = now.date()
+    if _CLOCK_CACHE[0] != today:
+        _CLOCK_CACHE[0] = today
+        _CLOCK_CACHE[1] = now.strftime("%A, %B %d %Y ")
+    put(1, _CLOCK_CACHE[1] + now.strftime("%H:%M:%S"), cp(1))
+
+    put(3, "Weather", a_header)
     if weather.get("error"):
-        if curses.has_colors():
-            stdscr.attron(curses.color_pair(5))
-        safe_addstr(stdscr, 4, 0, f"  Error: {weather['error']}")
-        if curses.has_colors():
-            stdscr.attroff(curses.color_pair(5))
+        put(4, f"  Error: {weather['error']}", a_err)
     else:
         w = parse_weather(weather)
-        safe_addstr(
-            stdscr,
-            4,
-            0,
-            f"  {w['desc']}  Temp {fmt_temp(w['temp'])} (Feels {fmt_temp(w['apparent'])})",
-        )
-        safe_addstr(
-            stdscr,
+        put(4, f"  {w['desc']}  Temp {fmt_temp(w['temp'])} (Feels {fmt_temp(w['apparent'])})")
+        put(
             5,
-            0,
             f"  Humidity {w['humidity'] if w['humidity'] is not None else 'N/A'}%  "
             f"Wind {w['wind'] if w['wind'] is not None else 'N/A'} km/h {fmt_wind_dir(w['wind_dir'])}",
         )
 
-    stocks = get_stocks()
-    if curses.has_colors():
-        stdscr.attron(curses.color_pair(2) | curses.A_BOLD)
-    safe_addstr(stdscr, 7, 0, "Stocks")
-    if curses.has_colors():
-        stdscr.attroff(curses.color_pair(2) | curses.A_BOLD)
+    put(7, "Stocks", a_header)
     stock_y = 8
     if stocks.get("error"):
-        if curses.has_colors():
-            stdscr.attron(curses.color_pair(5))
-        safe_addstr(stdscr, stock_y, 0, f"  Error: {stocks['error']}"[: width - 1])
-        if curses.has_colors():
-            stdscr.attroff(curses.color_pair(5))
+        put(stock_y, f"  Error: {stocks['error']}", a_err)
         stock_y += 1
     else:
         for item in stocks.get("items", [])[:5]:
             if stock_y >= height - 1:
                 break
-            symbol = item.get("symbol", "")
-            open_p = to_float(item.get("open"))
-            high_p = to_float(item.get("high"))
-            low_p = to_float(item.get("low"))
-            close_p = to_float(item.get("close"))
+            if isinstance(item, dict):  # cache files written before projection
+                item = (
+                    item.get("symbol", ""),
+                    item.get("date", ""),
+                    item.get("time", ""),
+                    item.get("open"),
+                    item.get("high"),
+                    item.get("low"),
+                    item.get("close"),
+                    item.get("volume"),
+                )
+            if len(item) < 12:  # cache rows from before float pre-coercion
+                item = tuple(item[:8]) + (
+                    to_float(item[3]),
+                    to_float(item[4]),
+                    to_float(item[5]),
+                    to_float(item[6]),
+                )
+            symbol = item[0]
+            open_p, high_p, low_p, close_p = item[8:12]
             change = None
             pct = None
             arrow = "•"
@@ -984,153 +1290,170 @@ def draw(stdscr, weather, news, now, status=""):
                 f"  {symbol:<8} {arrow} {fmt_num(close_p)} "
                 f"{fmt_num(change)} ({fmt_num(pct, 1)}%) "
                 f"R {fmt_num(low_p)}-{fmt_num(high_p)} "
-                f"V {fmt_volume(item.get('volume'))}"
+                f"V {fmt_volume(item[7])}"
             )
-            if color and curses.has_colors():
-                stdscr.attron(curses.color_pair(color))
-            safe_addstr(stdscr, stock_y, 0, line[: width - 1])
-            if color and curses.has_colors():
-                stdscr.attroff(curses.color_pair(color))
+            put(stock_y, line, cp(color) if color else 0)
             stock_y += 1
 
     schedule_text = ", ".join(NEWS_SCHEDULE) if NEWS_SCHEDULE else "manual"
-    if curses.has_colors():
-        stdscr.attron(curses.color_pair(3) | curses.A_BOLD)
-    safe_addstr(
-        stdscr,
+    put(
         stock_y + 1,
-        0,
-        f"News - X search: {X_SEARCH_QUERY} (schedule {schedule_text})"[: width - 1],
+        f"News - X search: {X_SEARCH_QUERY} (schedule {schedule_text})",
+        a_news,
     )
-    if curses.has_colors():
-        stdscr.attroff(curses.color_pair(3) | curses.A_BOLD)
     n = parse_news(news)
     if n.get("fetched_at"):
-        safe_addstr(
-            stdscr,
-            stock_y + 2,
-            0,
-            f"  Updated: {fmt_iso_datetime(n['fetched_at'])}"[: width - 1],
-        )
+        put(stock_y + 2, f"  Updated: {fmt_iso_datetime(n['fetched_at'])}")
         base_y = stock_y + 3
     else:
         base_y = stock_y + 2
     if n["error"]:
-        if curses.has_colors():
-            stdscr.attron(curses.color_pair(5))
-        safe_addstr(stdscr, base_y, 0, f"  Error: {n['error']}"[: width - 1])
+        put(base_y, f"  Error: {n['error']}", a_err)
         if n.get("raw"):
-            safe_addstr(stdscr, base_y + 1, 0, f"  Raw: {n['raw']}"[: width - 1])
-        if curses.has_colors():
-            stdscr.attroff(curses.color_pair(5))
+            put(base_y + 1, f"  Raw: {n['raw']}", a_err)
     elif not n["items"]:
-        safe_addstr(stdscr, base_y, 0, "  No results")
+        put(base_y, "  No results")
     else:
         y = base_y
         if n.get("summary"):
-            summary_lines = wrap_line("  ", n["summary"], width - 1)
-            for line in summary_lines:
+            for line in wrap("  ", n["summary"], width - 1):
                 if y >= height - 1:
                     break
-                safe_addstr(stdscr, y, 0, line)
+                put(y, line)
                 y += 1
             if y < height - 1:
                 y += 1
         elif n.get("summary_error"):
-            safe_addstr(
-                stdscr,
-                y,
-                0,
-                f"  Summary error: {n['summary_error']}"[: width - 1],
-            )
+            put(y, f"  Summary error: {n['summary_error']}")
             y += 1
         else:
-            safe_addstr(stdscr, y, 0, "  (summary not available)")
+            put(y, "  (summary not available)")
             y += 1
-        if not SHOW_POSTS:
-            pass
-        else:
+        if SHOW_POSTS:
             for item in n["items"]:
                 if y >= height - 1:
                     break
-                lines = wrap_line("  ", item["text"], width - 1)
-                for line in lines:
+                for line in wrap("  ", item["text"], width - 1):
                     if y >= height - 1:
                         break
-                    safe_addstr(stdscr, y, 0, line)
+                    put(y, line)
                     y += 1
                 if y >= height - 1:
                     break
-                meta_label = f"@{item['user']} {fmt_time(item['time'])}"
-                meta = f"  {meta_label}"
-                if curses.has_colors():
-                    stdscr.attron(curses.color_pair(4))
-                safe_addstr(stdscr, y, 0, meta[: width - 1])
-                if curses.has_colors():
-                    stdscr.attroff(curses.color_pair(4))
+                put(y, f"  @{item['user']} {fmt_time(item['time'])}", a_meta)
                 y += 1
                 if y >= height - 1:
                     break
                 if SHOW_LINKS:
                     url = item.get("url", "")
                     if url:
-                        url_lines = wrap_line("  ", url, width - 1)
-                        for line in url_lines:
+                        for line in wrap("  ", url, width - 1):
                             if y >= height - 1:
                                 break
-                            if curses.has_colors():
-                                stdscr.attron(curses.color_pair(6))
-                            safe_addstr(stdscr, y, 0, line)
-                            if curses.has_colors():
-                                stdscr.attroff(curses.color_pair(6))
+                            put(y, line, a_link)
                             y += 1
                 if y >= height - 1:
                     break
                 y += 1
 
-    footer = "Press q to quit | s settings | r refresh | h hide posts"
-    if status:
-        footer = f"{footer} | {status}"
-    if curses.has_colors():
-        stdscr.attron(curses.color_pair(9) | curses.A_DIM)
-    safe_addstr(stdscr, height - 1, 0, footer[: width - 1])
-    if curses.has_colors():
-        stdscr.attroff(curses.color_pair(9) | curses.A_DIM)
-    stdscr.refresh()
+    footer = f"{_FOOTER} | {status}" if status else _FOOTER
+    put(height - 1, footer, cp(9) | curses.A_DIM)
+
+    prev_rows, prev_size = _LAST_FRAME
+    if prev_rows is None or prev_size != (height, width):
+        stdscr.erase()
+        prev_rows = {}
+    for y, row in rows.items():
+        if prev_rows.get(y) != row:
+            try:
+                stdscr.move(y, 0)
+                stdscr.clrtoeol()
+                stdscr.addstr(y, 0, row[0], row[1])
+            except curses.error:
+                pass
+    for y in prev_rows.keys() - rows.keys():
+        try:
+            stdscr.move(y, 0)
+            stdscr.clrtoeol()
+        except curses.error:
+            pass
+    _LAST_FRAME[0] = rows
+    _LAST_FRAME[1] = (height, width)
+    stdscr.noutrefresh()
+    curses.doupdate()
 
 
 def dashboard(stdscr):
     global SHOW_POSTS
     curses.curs_set(0)
-    stdscr.nodelay(True)
-    stdscr.timeout(0)
+    stdscr.timeout(1000)
     init_colors()
 
-    weather = {}
-    news = {}
-    last_weather_fetch = 0.0
+    # Stale-while-revalidate: show whatever the disk cache holds straight
+    # away, even if expired; the background fetches below replace it.
+    weather = read_cache("weather.json", None) or {}
+    stocks = read_cache("stocks.json", None) or {}
+    news = read_cache("news.json", None) or {}
+    # Monotonic timestamps for in-loop scheduling: a wall-clock step (NTP
+    # sync, DST) must not suppress or double-fire refreshes.
+    last_weather_fetch = None
+    pending = {}
+    force_news = False
+    forced_news_inflight = False
 
     status = ""
     while True:
-        now = dt.datetime.now(ZoneInfo(TIMEZONE))
-        now_ts = time.time()
-
-        if now_ts - last_weather_fetch > WEATHER_TTL_SECONDS or not weather:
+        now = dt.datetime.now(_TZ)
+        now_mono = time.monotonic()
+
+        # Dispatch fetches to the pool but never wait on them: the loop
+        # keeps drawing the last known data and picks up results on the
+        # tick after they complete, so a slow fetch cannot freeze the UI.
+        if "weather" not in pending and (
+            last_weather_fetch is None
+            or now_mono - last_weather_fetch > WEATHER_TTL_SECONDS
+            or not weather
+        ):
+            pending["weather"] = _POOL.submit(get_weather)
+            last_weather_fetch = now_mono
+        if "stocks" not in pending:
+            pending["stocks"] = _POOL.submit(get_stocks)
+        if "news" not in pending:
+            # Only one news fetch is ever in flight: a forced refresh
+            # waits here for the scheduled one to finish, so two calls
+            # can never race on news.json or the shared SDK client.
+            pending["news"] = _POOL.submit(get_news, now, force_news)
+            forced_news_inflight = force_news
+            force_news = False
+
+        for name in ("weather", "stocks", "news"):
+            future = pending.get(name)
+            if future is None or not future.done():
+                continue
+            del pending[name]
             try:
-                weather = get_weather()
+                result = future.result()
+                if name == "news" and forced_news_inflight:
+                    status = "Refreshed"
             except Exception as exc:
-                weather = {"error": str(exc)}
-            last_weather_fetch = now_ts
-
-        try:
-            news = get_news(now, force=False)
-        except Exception as exc:
-            news = {"error": str(exc)}
-            status = f"News error: {exc}"
-
-        draw(stdscr, weather, news, now, status)
+                result = {"error": str(exc)}
+                if name == "news":
+                    status = f"News error: {exc}"
+            if name == "news":
+                forced_news_inflight = False
+            if name == "weather":
+                weather = result
+            elif name == "stocks":
+                stocks = result
+            else:
+                news = result
+
+        draw(stdscr, weather, stocks, news, now, status)
         status = ""
 
+        # getkey honors the 1 s timeout set above: a keypress wakes the
+        # loop immediately, an idle tick parks in curses' poll instead of
+        # time.sleep.
         try:
             key = stdscr.getkey()
         except curses.error:
@@ -1139,25 +1462,19 @@ def dashboard(stdscr):
             break
         if key in ("r", "R"):
             status = "Refreshing..."
-            draw(stdscr, weather, news, now, status)
-            try:
-                refresh_news_cache()
-                refresh_stocks_cache()
-                news = get_news(now, force=True)
-                status = "Refreshed"
-            except Exception as exc:
-                news = {"error": str(exc)}
-                status = f"Refresh error: {exc}"
+            refresh_news_cache()
+            refresh_stocks_cache()
+            force_news = True
         if key in ("s", "S"):
             settings_screen(stdscr)
+            _LAST_FRAME[0] = None  # settings screen clobbered the display
         if key in ("h", "H"):
             SHOW_POSTS = not SHOW_POSTS
 
-        time.sleep(1)
-
 
 def main():
     try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
         ensure_xai_api_key()
         load_settings()
         curses.wrapper(dashboard)